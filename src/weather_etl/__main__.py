@@ -5,18 +5,39 @@ from __future__ import annotations
 import logging
 from datetime import UTC, datetime
 from functools import cache
+from pathlib import Path
 
 import typer
 
 from weather_etl.common.config import Settings
-from weather_etl.common.logger import configure_console_logging
+from weather_etl.common.logger import configure_console_logging, log_context
+from weather_etl.common.profiling import StageProfiler
+from weather_etl.devtools.fake_openweather import (
+    FakeOpenWeatherServer,
+    FakeServerConfig,
+    LatencyDistribution,
+)
+from weather_etl.devtools.load_test import Feed, random_locations, run_load_test
 from weather_etl.ingestion.openweather_client import OpenWeatherClient
+from weather_etl.ingestion.ops.load.base import ForecastSink, QuarantineStore
 from weather_etl.ingestion.ops.load.postgres_loader import PostgresLoader
 from weather_etl.ingestion.ops.transform.normalize import normalize_daily_30d, normalize_hourly_4d
+from weather_etl.ingestion.ops.transform.validate import validate_daily, validate_hourly
 
 app = typer.Typer()
 logger = logging.getLogger("weather_etl")
 
+PROFILE_OPTION = typer.Option(
+    False, "--profile", help="Write per-stage cProfile and tracemalloc reports."
+)
+PROFILE_DIR_OPTION = typer.Option(
+    Path("profiles"), envvar="WEATHER_PROFILE_DIR", help="Directory for profiling reports."
+)
+FEED_OPTION = typer.Option(Feed.HOURLY, help="Feed to exercise.")
+LATENCY_DISTRIBUTION_OPTION = typer.Option(
+    LatencyDistribution.EXPONENTIAL, help="Fake server latency distribution."
+)
+
 
 @cache
 def _get_settings() -> Settings:
@@ -40,11 +61,32 @@ def _get_client() -> OpenWeatherClient:
 def _get_loader() -> PostgresLoader:
     """Create a PostgresLoader using current settings."""
     settings = _get_settings()
-    return PostgresLoader(settings.db_dsn)
+    return PostgresLoader(
+        settings.db_dsn,
+        workers=settings.db_load_workers,
+        chunk_size=settings.db_load_chunk_size,
+    )
+
+
+def _get_extra_sinks() -> list[ForecastSink]:
+    """Create optional sinks written alongside PostgreSQL."""
+    settings = _get_settings()
+    sinks: list[ForecastSink] = []
+    if settings.parquet_dir:
+        from weather_etl.ingestion.ops.load.parquet_sink import ParquetSink
+
+        sinks.append(
+            ParquetSink(
+                settings.parquet_dir,
+                compression=settings.parquet_compression,
+                row_group_size=settings.parquet_row_group_size,
+            )
+        )
+    return sinks
 
 
 @app.command()
-def run_hourly() -> None:
+def run_hourly(profile: bool = PROFILE_OPTION, profile_dir: Path = PROFILE_DIR_OPTION) -> None:
     """
     Extract, transform, and load the 4-day hourly forecast.
     """
@@ -52,18 +94,33 @@ def run_hourly() -> None:
     settings = _get_settings()
     client = _get_client()
     loader = _get_loader()
+    extra_sinks = _get_extra_sinks()
+    profiler = StageProfiler(profile_dir, enabled=profile)
     try:
-        loader.init_schema()
-        raw_hourly = client.fetch_hourly_4d(settings.lat, settings.lon, settings.units)
-        hourly_rows = normalize_hourly_4d(raw_hourly, extracted_at)
-        loaded = loader.upsert_hourly(hourly_rows)
-        logger.info(f"Loaded {loaded} hourly rows")
+        with log_context(feed="hourly", lat=settings.lat, lon=settings.lon):
+            loader.init_schema()
+            with profiler.stage("hourly-extract"):
+                raw_hourly = client.fetch_hourly_4d(settings.lat, settings.lon, settings.units)
+            with profiler.stage("hourly-transform"):
+                hourly_rows, quarantined = validate_hourly(
+                    normalize_hourly_4d(raw_hourly, extracted_at)
+                )
+            with profiler.stage("hourly-load", threaded=settings.db_load_workers > 1):
+                if quarantined:
+                    stored = loader.quarantine(quarantined)
+                    logger.warning("Quarantined %d invalid hourly rows", stored)
+                loaded = loader.write_hourly(hourly_rows)
+                logger.info("Loaded %d hourly rows", loaded)
+                for sink in extra_sinks:
+                    written = sink.write_hourly(hourly_rows)
+                    sink.flush()
+                    logger.info("Wrote %d hourly rows to %s", written, type(sink).__name__)
     finally:
         client.close()
 
 
 @app.command()
-def run_daily() -> None:
+def run_daily(profile: bool = PROFILE_OPTION, profile_dir: Path = PROFILE_DIR_OPTION) -> None:
     """
     Extract, transform, and load the 30-day daily forecast.
     """
@@ -71,26 +128,121 @@ def run_daily() -> None:
     settings = _get_settings()
     client = _get_client()
     loader = _get_loader()
+    extra_sinks = _get_extra_sinks()
+    profiler = StageProfiler(profile_dir, enabled=profile)
     try:
-        loader.init_schema()
-        raw_daily = client.fetch_daily_30d(settings.lat, settings.lon, settings.units)
-        daily_rows = normalize_daily_30d(raw_daily, extracted_at)
-        loaded = loader.upsert_daily(daily_rows)
-        logger.info(f"Loaded {loaded} daily rows")
+        with log_context(feed="daily", lat=settings.lat, lon=settings.lon):
+            loader.init_schema()
+            with profiler.stage("daily-extract"):
+                raw_daily = client.fetch_daily_30d(settings.lat, settings.lon, settings.units)
+            with profiler.stage("daily-transform"):
+                daily_rows, quarantined = validate_daily(
+                    normalize_daily_30d(raw_daily, extracted_at)
+                )
+            with profiler.stage("daily-load", threaded=settings.db_load_workers > 1):
+                if quarantined:
+                    stored = loader.quarantine(quarantined)
+                    logger.warning("Quarantined %d invalid daily rows", stored)
+                loaded = loader.write_daily(daily_rows)
+                logger.info("Loaded %d daily rows", loaded)
+                for sink in extra_sinks:
+                    written = sink.write_daily(daily_rows)
+                    sink.flush()
+                    logger.info("Wrote %d daily rows to %s", written, type(sink).__name__)
     finally:
         client.close()
 
 
+@app.command()
+def load_test(
+    locations: int = typer.Option(100, help="Number of synthetic locations to fetch."),
+    feed: Feed = FEED_OPTION,
+    concurrency: int = typer.Option(8, help="Concurrent pipeline workers."),
+    latency_ms: float = typer.Option(50.0, help="Mean fake server latency in ms."),
+    latency_distribution: LatencyDistribution = LATENCY_DISTRIBUTION_OPTION,
+    error_rate: float = typer.Option(0.0, help="Share of requests answered with HTTP 500."),
+    rate_limit_rate: float = typer.Option(0.0, help="Share of requests answered with HTTP 429."),
+    invalid_rate: float = typer.Option(0.0, help="Share of forecast items with invalid values."),
+    retry_after_s: int = typer.Option(1, help="Retry-After seconds sent with 429 responses."),
+    min_interval_s: float = typer.Option(0.0, help="Client-side minimum interval between calls."),
+    max_retries: int = typer.Option(5, help="Client retry budget per request."),
+    load: bool = typer.Option(
+        False, help="Also load rows into PostgreSQL and any configured Parquet sink."
+    ),
+    seed: int | None = typer.Option(None, help="Seed for reproducible chaos."),
+    profile: bool = PROFILE_OPTION,
+    profile_dir: Path = PROFILE_DIR_OPTION,
+) -> None:
+    """
+    Drive the pipeline against a local fake OpenWeather server and report latency.
+    """
+    config = FakeServerConfig(
+        latency_ms=latency_ms,
+        latency_distribution=latency_distribution,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        invalid_rate=invalid_rate,
+        retry_after_s=retry_after_s,
+        seed=seed,
+    )
+    sinks: list[ForecastSink] = []
+    quarantine_store: QuarantineStore | None = None
+    if load:
+        loader = _get_loader()
+        loader.init_schema()
+        sinks = [loader, *_get_extra_sinks()]
+        quarantine_store = loader
+    with FakeOpenWeatherServer(config) as server:
+        client = OpenWeatherClient(
+            api_key="fake",
+            base_url=server.base_url,
+            max_retries=max_retries,
+            backoff_initial_s=0.1,
+            backoff_max_s=2.0,
+            min_interval_s=min_interval_s,
+        )
+        profiler = StageProfiler(profile_dir, enabled=profile)
+        try:
+            with profiler.stage(f"load-test-{feed}", threaded=True):
+                report = run_load_test(
+                    client,
+                    random_locations(locations, seed),
+                    feed=feed,
+                    concurrency=concurrency,
+                    sinks=sinks,
+                    quarantine_store=quarantine_store,
+                )
+        finally:
+            client.close()
+    logger.info("Load test: %s (server saw %d requests)", report.summary(), server.request_count)
+
+
+def _configure_logging() -> None:
+    """Configure logging from settings, using defaults when settings are incomplete."""
+    try:
+        settings = _get_settings()
+    except ValueError:
+        # Commands that need settings re-raise the error; load-test does not.
+        configure_console_logging()
+        return
+    configure_console_logging(
+        level=settings.log_level,
+        fmt=settings.log_format,
+        sample_limit=settings.log_sample_limit,
+        sample_interval_s=settings.log_sample_interval_s,
+    )
+
+
 def main() -> None:
     """
     Main entrypoint for the weather ETL pipeline.
     """
-    configure_console_logging()
+    _configure_logging()
     try:
         app()
     except SystemExit as exc:
         if exc.code != 0:
-            logger.warning(f"Error: {str(exc)}")
+            logger.warning("Error: %s", exc)
             raise
 
 
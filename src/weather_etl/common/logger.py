@@ -2,16 +2,223 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
+import queue
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from threading import Lock
+from typing import IO, Any
 
+LOGGER_NAME = "weather_etl"
+TEXT_FORMAT = "%(asctime)s - %(filename)s - %(levelname)s: %(message)s"
 
-def configure_console_logging() -> None:
-    """Configure console logging for the weather_etl logger."""
-    logger = logging.getLogger("weather_etl")
-    logger.setLevel(logging.INFO)
+_log_context: ContextVar[dict[str, Any] | None] = ContextVar(
+    "weather_etl_log_context", default=None
+)
+_STANDARD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
+    "context",
+    "suppressed",
+}
+_listener: QueueListener | None = None
+_traceback_formatter = logging.Formatter()
 
-    console_handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s - %(filename)s - %(levelname)s: %(message)s")
-    console_handler.setFormatter(formatter)
 
-    logger.addHandler(console_handler)
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Attach ``fields`` (e.g. ``lat``/``lon``) to every log record in this context."""
+    token = _log_context.set({**(_log_context.get() or {}), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the active ``log_context`` fields onto the record in the caller's thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.context = _log_context.get() or {}
+        return True
+
+
+@dataclass(slots=True)
+class _Window:
+    started: float
+    emitted: int = 1
+    suppressed: int = 0
+
+
+class SamplingFilter(logging.Filter):
+    """Let at most ``limit`` warnings per message template through every ``interval_s``.
+
+    Records are keyed by logger and the unformatted message, so callers must
+    use lazy ``%``-style arguments for repeats to be recognised. The first
+    record after a window closes carries ``suppressed`` with the dropped count.
+    Only records at exactly ``level`` are sampled; everything else passes.
+    """
+
+    def __init__(
+        self,
+        limit: int = 5,
+        interval_s: float = 60.0,
+        level: int = logging.WARNING,
+        max_keys: int = 1024,
+    ) -> None:
+        super().__init__()
+        self._limit = limit
+        self._interval_s = interval_s
+        self._level = level
+        self._max_keys = max_keys
+        self._windows: dict[tuple[str, int, str], _Window] = {}
+        self._lock = Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != self._level:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window.started >= self._interval_s:
+                if window is not None and window.suppressed:
+                    record.suppressed = window.suppressed
+                if window is None and len(self._windows) >= self._max_keys:
+                    self._prune(now)
+                self._windows[key] = _Window(started=now)
+                return True
+            if window.emitted < self._limit:
+                window.emitted += 1
+                return True
+            window.suppressed += 1
+            return False
+
+    def _prune(self, now: float) -> None:
+        expired = [k for k, w in self._windows.items() if now - w.started >= self._interval_s]
+        for key in expired or list(self._windows)[: self._max_keys // 2]:
+            del self._windows[key]
+
+
+class TextFormatter(logging.Formatter):
+    """Classic console format with context fields appended as ``key=value``."""
+
+    def __init__(self) -> None:
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = dict(getattr(record, "context", {}))
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            fields["suppressed"] = suppressed
+        if not fields:
+            return line
+        first, newline, rest = line.partition("\n")
+        extras = " ".join(f"{key}={value}" for key, value in fields.items())
+        return f"{first} [{extras}]{newline}{rest}"
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "context", {}))
+        entry.update(
+            (key, value) for key, value in record.__dict__.items() if key not in _STANDARD_ATTRS
+        )
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Enqueue records so the listener thread does the final formatting and I/O.
+
+    Like ``QueueHandler.prepare``, the message and traceback are rendered on
+    the caller's thread, so later mutation of ``args`` cannot change the log
+    line and no frames are kept alive in the queue. Unlike it, the record is
+    not run through the output formatter, so the listener can still render
+    JSON fields and context.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_console_logging(
+    level: str = "INFO",
+    fmt: str = "json",
+    sample_limit: int = 5,
+    sample_interval_s: float = 60.0,
+    stream: IO[str] | None = None,
+) -> QueueListener:
+    """Configure non-blocking console logging for the weather_etl logger.
+
+    Callers only enqueue records; a background ``QueueListener`` does the
+    formatting and stream I/O. Calling this again replaces the previous setup.
+    """
+    global _listener
+    if fmt not in ("json", "text"):
+        raise ValueError("log format must be 'json' or 'text'")
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level.upper())
+    shutdown_console_logging()
+
+    console_handler = logging.StreamHandler(stream)
+    console_handler.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_limit, sample_interval_s))
+    queue_handler.addFilter(ContextFilter())
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_console_logging() -> None:
+    """Detach the queue handler, then flush and stop the listener, if any."""
+    global _listener
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in [h for h in logger.handlers if isinstance(h, QueueHandler)]:
+        logger.removeHandler(handler)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_console_logging)
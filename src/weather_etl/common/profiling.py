@@ -0,0 +1,132 @@
+"""Opt-in per-stage CPU and memory profiling for pipeline runs."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+
+logger = logging.getLogger("weather_etl")
+
+THREADED_NOTE = (
+    "note: this stage runs work on worker threads. Before Python 3.12 cProfile only\n"
+    "records the calling thread, so worker time shows up as executor waits; on\n"
+    "3.12+ worker calls are merged in and call counts mix threads.\n"
+)
+
+
+class StageProfiler:
+    """Capture a cProfile and tracemalloc diff around each named pipeline stage.
+
+    Disabled profilers are a no-op. When enabled, each stage writes
+    ``<run_id>-<stage>.prof`` (loadable with ``pstats``/snakeviz) and
+    ``<run_id>-<stage>.txt`` with the top functions and allocation sites.
+    Failures while profiling or writing artifacts are logged and never abort
+    the pipeline.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        enabled: bool = False,
+        top_n: int = 25,
+        traceback_frames: int = 1,
+    ) -> None:
+        self.enabled = enabled
+        self._output_dir = Path(output_dir)
+        self._top_n = top_n
+        self._traceback_frames = traceback_frames
+        timestamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%SZ")
+        self._run_id = f"{timestamp}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.artifacts: list[Path] = []
+
+    @contextmanager
+    def stage(self, name: str, threaded: bool = False) -> Iterator[None]:
+        """Profile the enclosed block as stage ``name`` when enabled.
+
+        Pass ``threaded=True`` when the stage fans out to worker threads so the
+        report flags that their CPU time is not attributed reliably.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(self._traceback_frames)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        cpu_profile = cProfile.Profile()
+        profile: cProfile.Profile | None = cpu_profile
+        try:
+            cpu_profile.enable()
+        except ValueError:
+            logger.warning("CPU profiling unavailable for stage %s: profiler already active", name)
+            profile = None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_s = time.perf_counter() - started
+            if profile is not None:
+                profile.disable()
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            try:
+                self._write(name, profile, before, after, elapsed_s, peak, threaded)
+            except OSError as exc:
+                logger.warning("Could not write profile for stage %s: %s", name, exc)
+
+    def _write(
+        self,
+        name: str,
+        profile: cProfile.Profile | None,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+        elapsed_s: float,
+        peak_bytes: int,
+        threaded: bool,
+    ) -> None:
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self._output_dir / f"{self._run_id}-{name}"
+        summary = io.StringIO()
+        summary.write(f"stage: {name}\n")
+        summary.write(f"wall_time_s: {elapsed_s:.4f}\n")
+        summary.write(f"peak_traced_memory_kib: {peak_bytes / 1024:.1f}\n")
+        if threaded:
+            summary.write(THREADED_NOTE)
+        summary.write("\n")
+
+        if profile is not None:
+            prof_path = stem.with_suffix(".prof")
+            profile.dump_stats(prof_path)
+            self.artifacts.append(prof_path)
+            summary.write(f"== top {self._top_n} functions by cumulative time ==\n")
+            stats = pstats.Stats(profile, stream=summary)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._top_n)
+
+        summary.write(f"\n== top {self._top_n} allocation sites (net growth) ==\n")
+        for diff in after.compare_to(before, "lineno")[: self._top_n]:
+            summary.write(f"{diff}\n")
+
+        txt_path = stem.with_suffix(".txt")
+        txt_path.write_text(summary.getvalue(), encoding="utf-8")
+        self.artifacts.append(txt_path)
+        logger.info(
+            "Profiled stage %s: %.3fs, peak %.1f KiB -> %s",
+            name,
+            elapsed_s,
+            peak_bytes / 1024,
+            txt_path,
+        )
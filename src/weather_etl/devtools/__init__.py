@@ -0,0 +1 @@
+"""Local tooling for load and chaos testing."""
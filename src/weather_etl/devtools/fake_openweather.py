@@ -0,0 +1,232 @@
+"""Local stand-in for the OpenWeather Pro forecast endpoints."""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from types import TracebackType
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from weather_etl.ingestion.openweather_client import (
+    FOUR_DAY_HOURLY_ENDPOINT,
+    THIRTY_DAY_DAILY_ENDPOINT,
+)
+
+
+class LatencyDistribution(StrEnum):
+    """Shape of the delay the fake server adds to each response."""
+
+    FIXED = "fixed"
+    UNIFORM = "uniform"
+    EXPONENTIAL = "exponential"
+
+
+HOURLY_ITEMS = 96
+DAILY_ITEMS = 30
+
+
+@dataclass(slots=True)
+class FakeServerConfig:
+    """Chaos knobs applied to every request the fake server receives."""
+
+    latency_ms: float = 0.0
+    latency_distribution: LatencyDistribution = LatencyDistribution.FIXED
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    invalid_rate: float = 0.0
+    retry_after_s: int | None = 1
+    seed: int | None = None
+    _rng: random.Random = field(init=False)
+    _rng_lock: Lock = field(default_factory=Lock, init=False)
+
+    def __post_init__(self) -> None:
+        for name in ("error_rate", "rate_limit_rate", "invalid_rate"):
+            value = getattr(self, name)
+            if not 0 <= value <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.latency_ms < 0:
+            raise ValueError("latency_ms must be >= 0")
+        self._rng = random.Random(self.seed)
+
+    def sample_latency_s(self) -> float:
+        """Draw one response delay from the configured distribution."""
+        if self.latency_ms == 0:
+            return 0.0
+        with self._rng_lock:
+            if self.latency_distribution is LatencyDistribution.UNIFORM:
+                value = self._rng.uniform(0, 2 * self.latency_ms)
+            elif self.latency_distribution is LatencyDistribution.EXPONENTIAL:
+                value = self._rng.expovariate(1 / self.latency_ms)
+            else:
+                value = self.latency_ms
+        return value / 1000
+
+    def roll(self) -> float:
+        """Draw a uniform number in ``[0, 1)`` for fault injection."""
+        with self._rng_lock:
+            return self._rng.random()
+
+
+class FakeOpenWeatherServer:
+    """Threaded HTTP server that mimics OpenWeather, usable as a context manager."""
+
+    def __init__(self, config: FakeServerConfig | None = None, port: int = 0) -> None:
+        self.config = config or FakeServerConfig()
+        self.request_count = 0
+        self._count_lock = Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL to pass to ``OpenWeatherClient(base_url=...)``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> FakeOpenWeatherServer:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _count(self) -> None:
+        with self._count_lock:
+            self.request_count += 1
+
+
+def _make_handler(server: FakeOpenWeatherServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            server._count()
+            config = server.config
+            time.sleep(config.sample_latency_s())
+
+            url = urlsplit(self.path)
+            if url.path == FOUR_DAY_HOURLY_ENDPOINT:
+                builder = _hourly_payload
+            elif url.path == THIRTY_DAY_DAILY_ENDPOINT:
+                builder = _daily_payload
+            else:
+                self._send(404, {"cod": "404", "message": "not found"})
+                return
+
+            roll = config.roll()
+            if roll < config.rate_limit_rate:
+                headers = {}
+                if config.retry_after_s is not None:
+                    headers["Retry-After"] = str(config.retry_after_s)
+                self._send(429, {"cod": 429, "message": "rate limited"}, headers)
+                return
+            if roll < config.rate_limit_rate + config.error_rate:
+                self._send(500, {"cod": "500", "message": "injected failure"})
+                return
+
+            query = parse_qs(url.query)
+            lat = float(query.get("lat", ["0"])[0])
+            lon = float(query.get("lon", ["0"])[0])
+            payload = builder(lat, lon)
+            for item in payload["list"]:
+                if config.invalid_rate and config.roll() < config.invalid_rate:
+                    _corrupt(item)
+            self._send(200, payload)
+
+        def _send(
+            self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None
+        ) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return None
+
+    return Handler
+
+
+def _city(lat: float, lon: float) -> dict[str, Any]:
+    return {"name": f"Fake {lat:.2f},{lon:.2f}", "country": "ZZ", "coord": {"lat": lat, "lon": lon}}
+
+
+def _corrupt(item: dict[str, Any]) -> None:
+    """Push humidity out of the 0-100 range the schema allows."""
+    target = item["main"] if "main" in item else item
+    target["humidity"] = 150
+
+
+def _hourly_payload(lat: float, lon: float) -> dict[str, Any]:
+    start = int(time.time()) // 3600 * 3600
+    items = [
+        {
+            "dt": start + hour * 3600,
+            "main": {
+                "temp": 10.0,
+                "feels_like": 9.0,
+                "temp_min": 8.0,
+                "temp_max": 12.0,
+                "pressure": 1015,
+                "sea_level": 1015,
+                "grnd_level": 1010,
+                "humidity": 60,
+            },
+            "weather": [{"id": 800, "main": "Clear", "description": "clear sky", "icon": "01d"}],
+            "clouds": {"all": 5},
+            "wind": {"speed": 3.2, "deg": 180, "gust": 4.1},
+            "visibility": 10000,
+            "pop": 0.1,
+            "sys": {"pod": "d" if 6 <= hour % 24 < 18 else "n"},
+        }
+        for hour in range(HOURLY_ITEMS)
+    ]
+    return {"cod": "200", "cnt": len(items), "list": items, "city": _city(lat, lon)}
+
+
+def _daily_payload(lat: float, lon: float) -> dict[str, Any]:
+    start = int(time.time()) // 86400 * 86400 + 12 * 3600
+    items = [
+        {
+            "dt": start + day * 86400,
+            "sunrise": start + day * 86400 - 6 * 3600,
+            "sunset": start + day * 86400 + 6 * 3600,
+            "temp": {"day": 15.0, "min": 8.0, "max": 18.0, "night": 9.0, "eve": 13.0, "morn": 10.0},
+            "feels_like": {"day": 14.0, "night": 8.0, "eve": 12.0, "morn": 9.0},
+            "pressure": 1016,
+            "humidity": 55,
+            "weather": [{"id": 500, "main": "Rain", "description": "light rain", "icon": "10d"}],
+            "speed": 4.5,
+            "deg": 270,
+            "clouds": 40,
+            "rain": 0.5,
+        }
+        for day in range(DAILY_ITEMS)
+    ]
+    return {"cod": "200", "cnt": len(items), "list": items, "city": _city(lat, lon)}
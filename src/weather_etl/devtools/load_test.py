@@ -0,0 +1,183 @@
+"""Concurrent pipeline driver that reports throughput and latency percentiles."""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+
+from weather_etl.common.logger import log_context
+from weather_etl.ingestion.openweather_client import OpenWeatherClient
+from weather_etl.ingestion.ops.load.base import ForecastSink, QuarantineStore
+from weather_etl.ingestion.ops.transform.normalize import normalize_daily_30d, normalize_hourly_4d
+from weather_etl.ingestion.ops.transform.validate import (
+    QuarantinedRecord,
+    validate_daily,
+    validate_hourly,
+)
+
+logger = logging.getLogger("weather_etl")
+
+
+class Feed(StrEnum):
+    """Forecast feed exercised by the load test."""
+
+    HOURLY = "hourly"
+    DAILY = "daily"
+
+
+@dataclass(frozen=True, slots=True)
+class LoadTestReport:
+    """Outcome of a load-test run."""
+
+    locations: int
+    succeeded: int
+    failed: int
+    rows: int
+    quarantined: int
+    elapsed_s: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    loaded: int = 0
+    load_s: float = 0.0
+    load_errors: int = 0
+
+    @property
+    def runs_per_s(self) -> float:
+        """Completed per-location pipeline runs per second."""
+        return self.locations / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def summary(self) -> str:
+        """Render the report as a single human-readable line."""
+        return (
+            f"locations={self.locations} ok={self.succeeded} failed={self.failed} "
+            f"rows={self.rows} quarantined={self.quarantined} elapsed={self.elapsed_s:.2f}s "
+            f"throughput={self.runs_per_s:.2f} runs/s "
+            f"p50={self.p50_ms:.1f}ms p90={self.p90_ms:.1f}ms "
+            f"p99={self.p99_ms:.1f}ms max={self.max_ms:.1f}ms "
+            f"loaded={self.loaded} load={self.load_s:.2f}s load_errors={self.load_errors}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Outcome:
+    latency_ms: float
+    rows: list[Any]
+    rejected: list[QuarantinedRecord]
+    ok: bool
+
+
+def random_locations(count: int, seed: int | None = None) -> list[tuple[float, float]]:
+    """Generate ``count`` distinct-looking (lat, lon) pairs."""
+    rng = random.Random(seed)
+    return [
+        (round(rng.uniform(-60, 70), 4), round(rng.uniform(-180, 180), 4)) for _ in range(count)
+    ]
+
+
+def run_load_test(
+    client: OpenWeatherClient,
+    locations: list[tuple[float, float]],
+    feed: Feed = Feed.HOURLY,
+    concurrency: int = 8,
+    sinks: Sequence[ForecastSink] = (),
+    quarantine_store: QuarantineStore | None = None,
+) -> LoadTestReport:
+    """Extract and normalize every location concurrently, then load once.
+
+    Latency covers the per-location extract and transform, retries included, so
+    rate limiting and backoff show up in the percentiles. Valid rows from all
+    locations are written to each of ``sinks`` as a single batch, which is what
+    lets ``PostgresLoader`` spread them over its workers; ``loaded`` sums the
+    rows written across sinks. Rejected rows are counted and stored when
+    ``quarantine_store`` is given.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    def pipeline(lat: float, lon: float) -> tuple[list[Any], list[QuarantinedRecord]]:
+        extracted_at = datetime.now(tz=UTC)
+        if feed is Feed.HOURLY:
+            return validate_hourly(
+                normalize_hourly_4d(client.fetch_hourly_4d(lat, lon), extracted_at)
+            )
+        return validate_daily(normalize_daily_30d(client.fetch_daily_30d(lat, lon), extracted_at))
+
+    def run_one(location: tuple[float, float]) -> _Outcome:
+        lat, lon = location
+        started = time.perf_counter()
+        with log_context(feed=feed, lat=lat, lon=lon):
+            try:
+                (rows, rejected), ok = pipeline(lat, lon), True
+            except Exception as exc:  # one failed location must not abort the run
+                logger.warning("Load-test location failed: %s: %s", type(exc).__name__, exc)
+                rows, rejected, ok = [], [], False
+        return _Outcome((time.perf_counter() - started) * 1000, rows, rejected, ok)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(run_one, locations))
+    rows = [row for outcome in outcomes for row in outcome.rows]
+    rejected = [record for outcome in outcomes for record in outcome.rejected]
+
+    def load(sink: ForecastSink) -> int:
+        written = sink.write_hourly(rows) if feed is Feed.HOURLY else sink.write_daily(rows)
+        sink.flush()
+        return written
+
+    loaded, load_errors = 0, 0
+    load_started = time.perf_counter()
+    if rejected and quarantine_store is not None:
+        try:
+            quarantine_store.quarantine(rejected)
+        except Exception as exc:  # report what was measured instead of losing the run
+            logger.warning("Load-test quarantine failed: %s: %s", type(exc).__name__, exc)
+            load_errors += 1
+    for sink in sinks:
+        try:
+            loaded += load(sink)
+        except Exception as exc:  # same as above, and keep loading the other sinks
+            logger.warning(
+                "Load-test load into %s failed: %s: %s",
+                type(sink).__name__,
+                type(exc).__name__,
+                exc,
+            )
+            load_errors += 1
+    load_s = time.perf_counter() - load_started
+    elapsed_s = time.perf_counter() - started
+
+    latencies = sorted(outcome.latency_ms for outcome in outcomes)
+    succeeded = sum(1 for outcome in outcomes if outcome.ok)
+    return LoadTestReport(
+        locations=len(outcomes),
+        succeeded=succeeded,
+        failed=len(outcomes) - succeeded,
+        rows=len(rows),
+        quarantined=len(rejected),
+        elapsed_s=elapsed_s,
+        p50_ms=percentile(latencies, 50),
+        p90_ms=percentile(latencies, 90),
+        p99_ms=percentile(latencies, 99),
+        max_ms=latencies[-1] if latencies else 0.0,
+        loaded=loaded,
+        load_s=load_s,
+        load_errors=load_errors,
+    )
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
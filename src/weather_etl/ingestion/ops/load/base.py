@@ -0,0 +1,32 @@
+"""Sink contract shared by all loading backends."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from weather_etl.ingestion.models.types import DailyForecastRecord, HourlyForecastRecord
+from weather_etl.ingestion.ops.transform.validate import QuarantinedRecord
+
+
+class ForecastSink(Protocol):
+    """Destination able to persist normalized forecast batches."""
+
+    def write_hourly(self, rows: list[HourlyForecastRecord]) -> int:
+        """Persist hourly records and return the number of rows written."""
+        ...
+
+    def write_daily(self, rows: list[DailyForecastRecord]) -> int:
+        """Persist daily records and return the number of rows written."""
+        ...
+
+    def flush(self) -> None:
+        """Persist anything the sink has buffered."""
+        ...
+
+
+class QuarantineStore(Protocol):
+    """Destination for records rejected by validation."""
+
+    def quarantine(self, records: list[QuarantinedRecord]) -> int:
+        """Persist rejected records and return the number stored."""
+        ...
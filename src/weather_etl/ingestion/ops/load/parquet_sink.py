@@ -0,0 +1,177 @@
+"""Columnar Parquet sink for normalized weather records."""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from datetime import date
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from weather_etl.ingestion.models.types import DailyForecastRecord, HourlyForecastRecord
+
+HOURLY_DATASET = "hourly_forecast"
+DAILY_DATASET = "daily_forecast"
+PARTITION_COLUMN = "extracted_date"
+
+_TS = pa.timestamp("us", tz="UTC")
+
+HOURLY_SCHEMA = pa.schema(
+    [
+        pa.field("location_name", pa.string(), nullable=False),
+        pa.field("country_code", pa.string(), nullable=False),
+        pa.field("lat", pa.float64(), nullable=False),
+        pa.field("lon", pa.float64(), nullable=False),
+        pa.field("forecast_at_utc", _TS, nullable=False),
+        pa.field("temperature_c", pa.float64(), nullable=False),
+        pa.field("feels_like_c", pa.float64(), nullable=False),
+        pa.field("temp_min_c", pa.float64(), nullable=False),
+        pa.field("temp_max_c", pa.float64(), nullable=False),
+        pa.field("pressure_hpa", pa.int32(), nullable=False),
+        pa.field("sea_level_hpa", pa.int32()),
+        pa.field("ground_level_hpa", pa.int32()),
+        pa.field("humidity_pct", pa.int32(), nullable=False),
+        pa.field("cloudiness_pct", pa.int32(), nullable=False),
+        pa.field("wind_speed_ms", pa.float64(), nullable=False),
+        pa.field("wind_deg", pa.int32(), nullable=False),
+        pa.field("wind_gust_ms", pa.float64()),
+        pa.field("visibility_m", pa.int32()),
+        pa.field("precipitation_probability", pa.float64(), nullable=False),
+        pa.field("rain_1h_mm", pa.float64(), nullable=False),
+        pa.field("weather_code", pa.int32(), nullable=False),
+        pa.field("weather_main", pa.string(), nullable=False),
+        pa.field("weather_description", pa.string(), nullable=False),
+        pa.field("weather_icon", pa.string(), nullable=False),
+        pa.field("pod", pa.string()),
+        pa.field("source_payload_ts", _TS, nullable=False),
+    ]
+)
+
+DAILY_SCHEMA = pa.schema(
+    [
+        pa.field("location_name", pa.string(), nullable=False),
+        pa.field("country_code", pa.string(), nullable=False),
+        pa.field("lat", pa.float64(), nullable=False),
+        pa.field("lon", pa.float64(), nullable=False),
+        pa.field("forecast_date", pa.date32(), nullable=False),
+        pa.field("sunrise_utc", _TS),
+        pa.field("sunset_utc", _TS),
+        pa.field("temp_day_c", pa.float64(), nullable=False),
+        pa.field("temp_min_c", pa.float64(), nullable=False),
+        pa.field("temp_max_c", pa.float64(), nullable=False),
+        pa.field("temp_night_c", pa.float64(), nullable=False),
+        pa.field("temp_evening_c", pa.float64(), nullable=False),
+        pa.field("temp_morning_c", pa.float64(), nullable=False),
+        pa.field("feels_like_day_c", pa.float64()),
+        pa.field("feels_like_night_c", pa.float64()),
+        pa.field("feels_like_evening_c", pa.float64()),
+        pa.field("feels_like_morning_c", pa.float64()),
+        pa.field("pressure_hpa", pa.int32(), nullable=False),
+        pa.field("humidity_pct", pa.int32(), nullable=False),
+        pa.field("wind_speed_ms", pa.float64(), nullable=False),
+        pa.field("wind_deg", pa.int32(), nullable=False),
+        pa.field("cloudiness_pct", pa.int32(), nullable=False),
+        pa.field("rain_mm", pa.float64(), nullable=False),
+        pa.field("weather_code", pa.int32(), nullable=False),
+        pa.field("weather_main", pa.string(), nullable=False),
+        pa.field("weather_description", pa.string(), nullable=False),
+        pa.field("weather_icon", pa.string(), nullable=False),
+        pa.field("source_payload_ts", _TS, nullable=False),
+    ]
+)
+
+
+class ParquetSink:
+    """Buffered, append-only Parquet writer partitioned by extraction date.
+
+    Writes are buffered across calls (and threads) and flushed as one file per
+    dataset and ``extracted_date`` under
+    ``<root>/<dataset>/extracted_date=YYYY-MM-DD/part-<id>.parquet``, so a run
+    covering many locations produces a few large files with full row groups.
+    Rows are sorted by forecast time before writing, which keeps row-group
+    statistics on ``forecast_at_utc``/``forecast_date`` selective. Files are
+    never rewritten; readers deduplicate on ``(lat, lon, forecast time)`` by
+    keeping the latest ``source_payload_ts``.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        compression: str = "zstd",
+        row_group_size: int = 64_000,
+        flush_rows: int = 256_000,
+    ) -> None:
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
+        if flush_rows <= 0:
+            raise ValueError("flush_rows must be positive")
+        self._root = Path(root)
+        self._compression = compression
+        self._row_group_size = row_group_size
+        self._flush_rows = flush_rows
+        self._buffers: dict[str, list[Any]] = {HOURLY_DATASET: [], DAILY_DATASET: []}
+        self._lock = Lock()
+
+    def write_hourly(self, rows: list[HourlyForecastRecord]) -> int:
+        """Buffer hourly records, flushing once ``flush_rows`` are pending."""
+        return self._buffer(HOURLY_DATASET, rows)
+
+    def write_daily(self, rows: list[DailyForecastRecord]) -> int:
+        """Buffer daily records, flushing once ``flush_rows`` are pending."""
+        return self._buffer(DAILY_DATASET, rows)
+
+    def flush(self) -> None:
+        """Write every buffered row to new Parquet files."""
+        with self._lock:
+            for dataset in self._buffers:
+                self._flush_locked(dataset)
+
+    def _buffer(self, dataset: str, rows: Sequence[Any]) -> int:
+        with self._lock:
+            buffer = self._buffers[dataset]
+            buffer.extend(rows)
+            if len(buffer) >= self._flush_rows:
+                self._flush_locked(dataset)
+        return len(rows)
+
+    def _flush_locked(self, dataset: str) -> None:
+        rows, self._buffers[dataset] = self._buffers[dataset], []
+        if not rows:
+            return
+        schema, sort_key = _LAYOUTS[dataset]
+        partitions: dict[date, list[Any]] = defaultdict(list)
+        for row in rows:
+            partitions[row.source_payload_ts.date()].append(row)
+
+        batch_id = uuid.uuid4().hex
+        for day, part_rows in sorted(partitions.items()):
+            part_rows.sort(key=sort_key)
+            target_dir = self._root / dataset / f"{PARTITION_COLUMN}={day.isoformat()}"
+            target_dir.mkdir(parents=True, exist_ok=True)
+            target = target_dir / f"part-{batch_id}.parquet"
+            # Dot-prefixed files are skipped by dataset readers until renamed.
+            tmp = target_dir / f".{target.name}.tmp"
+            pq.write_table(
+                _to_table(schema, part_rows),
+                tmp,
+                compression=self._compression,
+                row_group_size=self._row_group_size,
+            )
+            tmp.replace(target)
+
+
+_LAYOUTS: dict[str, tuple[pa.Schema, Callable[[Any], Any]]] = {
+    HOURLY_DATASET: (HOURLY_SCHEMA, lambda row: (row.forecast_at_utc, row.lat, row.lon)),
+    DAILY_DATASET: (DAILY_SCHEMA, lambda row: (row.forecast_date, row.lat, row.lon)),
+}
+
+
+def _to_table(schema: pa.Schema, rows: Sequence[Any]) -> pa.Table:
+    """Build an Arrow table column by column from dataclass records."""
+    columns = {name: [getattr(row, name) for row in rows] for name in schema.names}
+    return pa.Table.from_pydict(columns, schema=schema)
@@ -2,19 +2,160 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import json
+import logging
+import math
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 import psycopg
+from psycopg.types.json import Jsonb
 
 from weather_etl.ingestion.models.types import DailyForecastRecord, HourlyForecastRecord
+from weather_etl.ingestion.ops.transform.validate import QuarantinedRecord
+
+logger = logging.getLogger("weather_etl")
+
+HOURLY_UPSERT_SQL = """
+    INSERT INTO weather.hourly_forecast (
+        location_name, country_code, lat, lon, forecast_at_utc,
+        temperature_c, feels_like_c, temp_min_c, temp_max_c,
+        pressure_hpa, sea_level_hpa, ground_level_hpa, humidity_pct,
+        cloudiness_pct, wind_speed_ms, wind_deg, wind_gust_ms,
+        visibility_m, precipitation_probability, rain_1h_mm,
+        weather_code, weather_main, weather_description, weather_icon,
+        pod, source_payload_ts
+    ) VALUES (
+        %(location_name)s, %(country_code)s, %(lat)s, %(lon)s, %(forecast_at_utc)s,
+        %(temperature_c)s, %(feels_like_c)s, %(temp_min_c)s, %(temp_max_c)s,
+        %(pressure_hpa)s, %(sea_level_hpa)s, %(ground_level_hpa)s, %(humidity_pct)s,
+        %(cloudiness_pct)s, %(wind_speed_ms)s, %(wind_deg)s, %(wind_gust_ms)s,
+        %(visibility_m)s, %(precipitation_probability)s, %(rain_1h_mm)s,
+        %(weather_code)s, %(weather_main)s, %(weather_description)s, %(weather_icon)s,
+        %(pod)s, %(source_payload_ts)s
+    )
+    ON CONFLICT (lat, lon, forecast_at_utc) DO UPDATE
+    SET
+        temperature_c = EXCLUDED.temperature_c,
+        feels_like_c = EXCLUDED.feels_like_c,
+        temp_min_c = EXCLUDED.temp_min_c,
+        temp_max_c = EXCLUDED.temp_max_c,
+        pressure_hpa = EXCLUDED.pressure_hpa,
+        sea_level_hpa = EXCLUDED.sea_level_hpa,
+        ground_level_hpa = EXCLUDED.ground_level_hpa,
+        humidity_pct = EXCLUDED.humidity_pct,
+        cloudiness_pct = EXCLUDED.cloudiness_pct,
+        wind_speed_ms = EXCLUDED.wind_speed_ms,
+        wind_deg = EXCLUDED.wind_deg,
+        wind_gust_ms = EXCLUDED.wind_gust_ms,
+        visibility_m = EXCLUDED.visibility_m,
+        precipitation_probability = EXCLUDED.precipitation_probability,
+        rain_1h_mm = EXCLUDED.rain_1h_mm,
+        weather_code = EXCLUDED.weather_code,
+        weather_main = EXCLUDED.weather_main,
+        weather_description = EXCLUDED.weather_description,
+        weather_icon = EXCLUDED.weather_icon,
+        pod = EXCLUDED.pod,
+        source_payload_ts = EXCLUDED.source_payload_ts;
+"""
+
+DAILY_UPSERT_SQL = """
+    INSERT INTO weather.daily_forecast (
+        location_name, country_code, lat, lon, forecast_date,
+        sunrise_utc, sunset_utc, temp_day_c, temp_min_c, temp_max_c,
+        temp_night_c, temp_evening_c, temp_morning_c,
+        feels_like_day_c, feels_like_night_c,
+        feels_like_evening_c, feels_like_morning_c,
+        pressure_hpa, humidity_pct, wind_speed_ms,
+        wind_deg, cloudiness_pct,
+        rain_mm, weather_code, weather_main,
+        weather_description, weather_icon,
+        source_payload_ts
+    ) VALUES (
+        %(location_name)s, %(country_code)s, %(lat)s, %(lon)s, %(forecast_date)s,
+        %(sunrise_utc)s, %(sunset_utc)s, %(temp_day_c)s, %(temp_min_c)s, %(temp_max_c)s,
+        %(temp_night_c)s, %(temp_evening_c)s, %(temp_morning_c)s,
+        %(feels_like_day_c)s, %(feels_like_night_c)s,
+        %(feels_like_evening_c)s, %(feels_like_morning_c)s,
+        %(pressure_hpa)s, %(humidity_pct)s, %(wind_speed_ms)s,
+        %(wind_deg)s, %(cloudiness_pct)s,
+        %(rain_mm)s, %(weather_code)s, %(weather_main)s,
+        %(weather_description)s, %(weather_icon)s,
+        %(source_payload_ts)s
+    )
+    ON CONFLICT (lat, lon, forecast_date) DO UPDATE
+    SET
+        sunrise_utc = EXCLUDED.sunrise_utc,
+        sunset_utc = EXCLUDED.sunset_utc,
+        temp_day_c = EXCLUDED.temp_day_c,
+        temp_min_c = EXCLUDED.temp_min_c,
+        temp_max_c = EXCLUDED.temp_max_c,
+        temp_night_c = EXCLUDED.temp_night_c,
+        temp_evening_c = EXCLUDED.temp_evening_c,
+        temp_morning_c = EXCLUDED.temp_morning_c,
+        feels_like_day_c = EXCLUDED.feels_like_day_c,
+        feels_like_night_c = EXCLUDED.feels_like_night_c,
+        feels_like_evening_c = EXCLUDED.feels_like_evening_c,
+        feels_like_morning_c = EXCLUDED.feels_like_morning_c,
+        pressure_hpa = EXCLUDED.pressure_hpa,
+        humidity_pct = EXCLUDED.humidity_pct,
+        wind_speed_ms = EXCLUDED.wind_speed_ms,
+        wind_deg = EXCLUDED.wind_deg,
+        cloudiness_pct = EXCLUDED.cloudiness_pct,
+        rain_mm = EXCLUDED.rain_mm,
+        weather_code = EXCLUDED.weather_code,
+        weather_main = EXCLUDED.weather_main,
+        weather_description = EXCLUDED.weather_description,
+        weather_icon = EXCLUDED.weather_icon,
+        source_payload_ts = EXCLUDED.source_payload_ts;
+"""
+
+QUARANTINE_INSERT_SQL = """
+    INSERT INTO weather.quarantine (feed, record, reasons)
+    VALUES (%(feed)s, %(record)s, %(reasons)s);
+"""
+
+_json_dumps = partial(json.dumps, default=str, allow_nan=False)
+
+
+def _finite_or_none(record: dict[str, Any]) -> dict[str, Any]:
+    """Replace NaN/Infinity with ``None``; JSONB only accepts strict JSON."""
+    return {
+        key: None if isinstance(value, float) and not math.isfinite(value) else value
+        for key, value in record.items()
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class LoadResult:
+    """Aggregated counters for a (possibly parallel) load."""
+
+    rows: int = 0
+    partitions: int = 0
+    chunks: int = 0
 
 
 class PostgresLoader:
-    """Responsible for schema bootstrap and idempotent upserts."""
+    """Responsible for schema bootstrap and idempotent upserts.
+
+    With ``workers > 1`` the sink entrypoints switch to the parallel path:
+    records are partitioned by ``(lat, lon)`` across independent connections,
+    each partition is sorted by its unique key so row locks are always taken in
+    the same order, and rows are committed in chunks of ``chunk_size``.
+    """
 
-    def __init__(self, dsn: str) -> None:
+    def __init__(self, dsn: str, workers: int = 1, chunk_size: int = 1000) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
         self._dsn = dsn
+        self._workers = workers
+        self._chunk_size = chunk_size
 
     def init_schema(self) -> None:
         """Create DB tables, constraints, and indexes if missing."""
@@ -25,56 +166,29 @@ class PostgresLoader:
                 cur.execute(ddl)
             conn.commit()
 
+    def write_hourly(self, rows: list[HourlyForecastRecord]) -> int:
+        """Sink entrypoint for hourly batches."""
+        if self._workers > 1:
+            return self.upsert_hourly_parallel(rows).rows
+        return self.upsert_hourly(rows)
+
+    def write_daily(self, rows: list[DailyForecastRecord]) -> int:
+        """Sink entrypoint for daily batches."""
+        if self._workers > 1:
+            return self.upsert_daily_parallel(rows).rows
+        return self.upsert_daily(rows)
+
+    def flush(self) -> None:
+        """No-op: every write is committed before it returns."""
+
     def upsert_hourly(self, rows: list[HourlyForecastRecord]) -> int:
         """Upsert hourly records using natural unique key."""
         if not rows:
             return 0
-        sql = """
-            INSERT INTO weather.hourly_forecast (
-                location_name, country_code, lat, lon, forecast_at_utc,
-                temperature_c, feels_like_c, temp_min_c, temp_max_c,
-                pressure_hpa, sea_level_hpa, ground_level_hpa, humidity_pct,
-                cloudiness_pct, wind_speed_ms, wind_deg, wind_gust_ms,
-                visibility_m, precipitation_probability, rain_1h_mm,
-                weather_code, weather_main, weather_description, weather_icon,
-                pod, source_payload_ts
-            ) VALUES (
-                %(location_name)s, %(country_code)s, %(lat)s, %(lon)s, %(forecast_at_utc)s,
-                %(temperature_c)s, %(feels_like_c)s, %(temp_min_c)s, %(temp_max_c)s,
-                %(pressure_hpa)s, %(sea_level_hpa)s, %(ground_level_hpa)s, %(humidity_pct)s,
-                %(cloudiness_pct)s, %(wind_speed_ms)s, %(wind_deg)s, %(wind_gust_ms)s,
-                %(visibility_m)s, %(precipitation_probability)s, %(rain_1h_mm)s,
-                %(weather_code)s, %(weather_main)s, %(weather_description)s, %(weather_icon)s,
-                %(pod)s, %(source_payload_ts)s
-            )
-            ON CONFLICT (lat, lon, forecast_at_utc) DO UPDATE
-            SET
-                temperature_c = EXCLUDED.temperature_c,
-                feels_like_c = EXCLUDED.feels_like_c,
-                temp_min_c = EXCLUDED.temp_min_c,
-                temp_max_c = EXCLUDED.temp_max_c,
-                pressure_hpa = EXCLUDED.pressure_hpa,
-                sea_level_hpa = EXCLUDED.sea_level_hpa,
-                ground_level_hpa = EXCLUDED.ground_level_hpa,
-                humidity_pct = EXCLUDED.humidity_pct,
-                cloudiness_pct = EXCLUDED.cloudiness_pct,
-                wind_speed_ms = EXCLUDED.wind_speed_ms,
-                wind_deg = EXCLUDED.wind_deg,
-                wind_gust_ms = EXCLUDED.wind_gust_ms,
-                visibility_m = EXCLUDED.visibility_m,
-                precipitation_probability = EXCLUDED.precipitation_probability,
-                rain_1h_mm = EXCLUDED.rain_1h_mm,
-                weather_code = EXCLUDED.weather_code,
-                weather_main = EXCLUDED.weather_main,
-                weather_description = EXCLUDED.weather_description,
-                weather_icon = EXCLUDED.weather_icon,
-                pod = EXCLUDED.pod,
-                source_payload_ts = EXCLUDED.source_payload_ts;
-        """
         payload = [asdict(row) for row in rows]
         with psycopg.connect(self._dsn) as conn:
             with conn.cursor() as cur:
-                cur.executemany(sql, payload)
+                cur.executemany(HOURLY_UPSERT_SQL, payload)
             conn.commit()
         return len(rows)
 
@@ -82,59 +196,94 @@ class PostgresLoader:
         """Upsert daily records using natural unique key."""
         if not rows:
             return 0
-        sql = """
-            INSERT INTO weather.daily_forecast (
-                location_name, country_code, lat, lon, forecast_date,
-                sunrise_utc, sunset_utc, temp_day_c, temp_min_c, temp_max_c,
-                temp_night_c, temp_evening_c, temp_morning_c,
-                feels_like_day_c, feels_like_night_c,
-                feels_like_evening_c, feels_like_morning_c,
-                pressure_hpa, humidity_pct, wind_speed_ms,
-                wind_deg, cloudiness_pct,
-                rain_mm, weather_code, weather_main,
-                weather_description, weather_icon,
-                source_payload_ts
-            ) VALUES (
-                %(location_name)s, %(country_code)s, %(lat)s, %(lon)s, %(forecast_date)s,
-                %(sunrise_utc)s, %(sunset_utc)s, %(temp_day_c)s, %(temp_min_c)s, %(temp_max_c)s,
-                %(temp_night_c)s, %(temp_evening_c)s, %(temp_morning_c)s,
-                %(feels_like_day_c)s, %(feels_like_night_c)s,
-                %(feels_like_evening_c)s, %(feels_like_morning_c)s,
-                %(pressure_hpa)s, %(humidity_pct)s, %(wind_speed_ms)s,
-                %(wind_deg)s, %(cloudiness_pct)s,
-                %(rain_mm)s, %(weather_code)s, %(weather_main)s,
-                %(weather_description)s, %(weather_icon)s,
-                %(source_payload_ts)s
-            )
-            ON CONFLICT (lat, lon, forecast_date) DO UPDATE
-            SET
-                sunrise_utc = EXCLUDED.sunrise_utc,
-                sunset_utc = EXCLUDED.sunset_utc,
-                temp_day_c = EXCLUDED.temp_day_c,
-                temp_min_c = EXCLUDED.temp_min_c,
-                temp_max_c = EXCLUDED.temp_max_c,
-                temp_night_c = EXCLUDED.temp_night_c,
-                temp_evening_c = EXCLUDED.temp_evening_c,
-                temp_morning_c = EXCLUDED.temp_morning_c,
-                feels_like_day_c = EXCLUDED.feels_like_day_c,
-                feels_like_night_c = EXCLUDED.feels_like_night_c,
-                feels_like_evening_c = EXCLUDED.feels_like_evening_c,
-                feels_like_morning_c = EXCLUDED.feels_like_morning_c,
-                pressure_hpa = EXCLUDED.pressure_hpa,
-                humidity_pct = EXCLUDED.humidity_pct,
-                wind_speed_ms = EXCLUDED.wind_speed_ms,
-                wind_deg = EXCLUDED.wind_deg,
-                cloudiness_pct = EXCLUDED.cloudiness_pct,
-                rain_mm = EXCLUDED.rain_mm,
-                weather_code = EXCLUDED.weather_code,
-                weather_main = EXCLUDED.weather_main,
-                weather_description = EXCLUDED.weather_description,
-                weather_icon = EXCLUDED.weather_icon,
-                source_payload_ts = EXCLUDED.source_payload_ts;
-        """
         payload = [asdict(row) for row in rows]
         with psycopg.connect(self._dsn) as conn:
             with conn.cursor() as cur:
-                cur.executemany(sql, payload)
+                cur.executemany(DAILY_UPSERT_SQL, payload)
             conn.commit()
         return len(rows)
+
+    def quarantine(self, records: list[QuarantinedRecord]) -> int:
+        """Store records rejected by validation together with their reasons."""
+        if not records:
+            return 0
+        payload = [
+            {
+                "feed": item.feed,
+                "record": Jsonb(_finite_or_none(item.record), dumps=_json_dumps),
+                "reasons": list(item.reasons),
+            }
+            for item in records
+        ]
+        with psycopg.connect(self._dsn) as conn:
+            with conn.cursor() as cur:
+                cur.executemany(QUARANTINE_INSERT_SQL, payload)
+            conn.commit()
+        return len(records)
+
+    def upsert_hourly_parallel(self, rows: list[HourlyForecastRecord]) -> LoadResult:
+        """Upsert hourly records across ``workers`` connections in key order."""
+        return self._upsert_parallel(
+            HOURLY_UPSERT_SQL, rows, lambda row: (row.lat, row.lon, row.forecast_at_utc)
+        )
+
+    def upsert_daily_parallel(self, rows: list[DailyForecastRecord]) -> LoadResult:
+        """Upsert daily records across ``workers`` connections in key order."""
+        return self._upsert_parallel(
+            DAILY_UPSERT_SQL, rows, lambda row: (row.lat, row.lon, row.forecast_date)
+        )
+
+    def _upsert_parallel(
+        self, sql: str, rows: Sequence[Any], sort_key: Callable[[Any], tuple[Any, ...]]
+    ) -> LoadResult:
+        partitions = partition_by_location(rows, self._workers, sort_key)
+        if not partitions:
+            return LoadResult()
+        with ThreadPoolExecutor(max_workers=len(partitions)) as pool:
+            results = list(pool.map(lambda part: self._load_partition(sql, part), partitions))
+        result = LoadResult(
+            rows=sum(r.rows for r in results),
+            partitions=len(results),
+            chunks=sum(r.chunks for r in results),
+        )
+        logger.info(
+            "Parallel upsert: %d rows over %d partitions in %d chunks",
+            result.rows,
+            result.partitions,
+            result.chunks,
+        )
+        return result
+
+    def _load_partition(self, sql: str, rows: Sequence[Any]) -> LoadResult:
+        """Load one pre-sorted partition on its own connection, committing per chunk."""
+        chunks = 0
+        with psycopg.connect(self._dsn) as conn:
+            for start in range(0, len(rows), self._chunk_size):
+                chunk = rows[start : start + self._chunk_size]
+                with conn.cursor() as cur:
+                    cur.executemany(sql, [asdict(row) for row in chunk])
+                conn.commit()
+                chunks += 1
+        return LoadResult(rows=len(rows), partitions=1, chunks=chunks)
+
+
+def partition_by_location(
+    rows: Sequence[Any], workers: int, sort_key: Callable[[Any], tuple[Any, ...]]
+) -> list[list[Any]]:
+    """Split rows into at most ``workers`` partitions keyed by ``(lat, lon)``.
+
+    All rows of a location land in the same partition, so no two connections
+    ever contend for the same unique-key rows. Locations are assigned greedily
+    to the least-loaded partition, and each partition is returned sorted by
+    ``sort_key``.
+    """
+    by_location: dict[tuple[float, float], list[Any]] = {}
+    for row in rows:
+        by_location.setdefault((row.lat, row.lon), []).append(row)
+
+    bins: list[list[Any]] = [[] for _ in range(min(workers, len(by_location)))]
+    for _, group in sorted(by_location.items(), key=lambda item: (-len(item[1]), item[0])):
+        min(bins, key=len).extend(group)
+    for part in bins:
+        part.sort(key=sort_key)
+    return bins
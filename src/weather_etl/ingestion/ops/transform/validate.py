@@ -0,0 +1,97 @@
+"""Row-level validation mirroring the CHECK constraints in ``sql/schema.sql``."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+from weather_etl.ingestion.models.types import DailyForecastRecord, HourlyForecastRecord
+
+RecordT = TypeVar("RecordT", HourlyForecastRecord, DailyForecastRecord)
+Rule = tuple[str, Callable[[Any], bool], str]
+
+
+@dataclass(frozen=True, slots=True)
+class QuarantinedRecord:
+    """A record rejected before loading, with every violated rule."""
+
+    feed: str
+    record: dict[str, Any]
+    reasons: tuple[str, ...]
+
+
+def _between(low: float, high: float) -> Callable[[Any], bool]:
+    return lambda value: low <= value <= high
+
+
+def _max_len(limit: int) -> Callable[[Any], bool]:
+    return lambda value: len(value) <= limit
+
+
+def _optional_max_len(limit: int) -> Callable[[Any], bool]:
+    return lambda value: value is None or len(value) <= limit
+
+
+def _positive(value: Any) -> bool:
+    return bool(value > 0)
+
+
+def _non_negative(value: Any) -> bool:
+    return bool(value >= 0)
+
+
+_COMMON_RULES: list[Rule] = [
+    ("country_code", _max_len(2), "country_code longer than 2 chars"),
+    ("weather_icon", _max_len(4), "weather_icon longer than 4 chars"),
+    ("pressure_hpa", _positive, "pressure_hpa must be > 0"),
+    ("humidity_pct", _between(0, 100), "humidity_pct must be between 0 and 100"),
+    ("cloudiness_pct", _between(0, 100), "cloudiness_pct must be between 0 and 100"),
+    ("wind_speed_ms", _non_negative, "wind_speed_ms must be >= 0"),
+    ("wind_deg", _between(0, 360), "wind_deg must be between 0 and 360"),
+]
+
+HOURLY_RULES: list[Rule] = [
+    *_COMMON_RULES,
+    (
+        "precipitation_probability",
+        _between(0, 1),
+        "precipitation_probability must be between 0 and 1",
+    ),
+    ("rain_1h_mm", _non_negative, "rain_1h_mm must be >= 0"),
+    ("pod", _optional_max_len(1), "pod longer than 1 char"),
+]
+
+DAILY_RULES: list[Rule] = [
+    *_COMMON_RULES,
+    ("rain_mm", _non_negative, "rain_mm must be >= 0"),
+]
+
+
+def validate_hourly(
+    rows: Sequence[HourlyForecastRecord],
+) -> tuple[list[HourlyForecastRecord], list[QuarantinedRecord]]:
+    """Split hourly rows into loadable records and quarantined ones."""
+    return _validate("hourly", rows, HOURLY_RULES)
+
+
+def validate_daily(
+    rows: Sequence[DailyForecastRecord],
+) -> tuple[list[DailyForecastRecord], list[QuarantinedRecord]]:
+    """Split daily rows into loadable records and quarantined ones."""
+    return _validate("daily", rows, DAILY_RULES)
+
+
+def _validate(
+    feed: str, rows: Sequence[RecordT], rules: list[Rule]
+) -> tuple[list[RecordT], list[QuarantinedRecord]]:
+    valid: list[RecordT] = []
+    quarantined: list[QuarantinedRecord] = []
+    for row in rows:
+        # NaN fails every comparison, so range checks also reject it.
+        reasons = tuple(message for name, check, message in rules if not check(getattr(row, name)))
+        if reasons:
+            quarantined.append(QuarantinedRecord(feed=feed, record=asdict(row), reasons=reasons))
+        else:
+            valid.append(row)
+    return valid, quarantined
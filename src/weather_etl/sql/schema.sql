@@ -79,3 +79,14 @@ CREATE INDEX IF NOT EXISTS idx_daily_forecast_date
 
 CREATE INDEX IF NOT EXISTS idx_daily_country_code
     ON weather.daily_forecast (country_code);
+
+CREATE TABLE IF NOT EXISTS weather.quarantine (
+    id BIGSERIAL PRIMARY KEY,
+    feed TEXT NOT NULL,
+    record JSONB NOT NULL,
+    reasons TEXT[] NOT NULL,
+    quarantined_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_quarantine_feed_at
+    ON weather.quarantine (feed, quarantined_at);
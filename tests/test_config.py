@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from weather_etl.common.config import Settings
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [("WEATHER_LOG_FORMAT", "yaml"), ("WEATHER_LOG_LEVEL", "LOUD")],
+)
+def test_settings_reject_invalid_logging_options(
+    monkeypatch: pytest.MonkeyPatch, name: str, value: str
+) -> None:
+    monkeypatch.setenv("OPENWEATHER_API_KEY", "k")
+    monkeypatch.setenv("OPENWEATHER_LAT", "1")
+    monkeypatch.setenv("OPENWEATHER_LON", "2")
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValueError, match=name):
+        Settings.from_env()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from weather_etl.devtools import load_test
+from weather_etl.devtools.fake_openweather import (
+    HOURLY_ITEMS,
+    FakeOpenWeatherServer,
+    FakeServerConfig,
+    LatencyDistribution,
+)
+from weather_etl.devtools.load_test import Feed, percentile, random_locations, run_load_test
+from weather_etl.ingestion.models.types import DailyForecastRecord, HourlyForecastRecord
+from weather_etl.ingestion.openweather_client import OpenWeatherClient
+from weather_etl.ingestion.ops.load.postgres_loader import PostgresLoader
+from weather_etl.ingestion.ops.transform.normalize import normalize_hourly_4d
+from weather_etl.ingestion.ops.transform.validate import QuarantinedRecord
+
+
+def _client(base_url: str, max_retries: int = 3) -> OpenWeatherClient:
+    return OpenWeatherClient(
+        api_key="k",
+        base_url=base_url,
+        max_retries=max_retries,
+        backoff_initial_s=0,
+        backoff_max_s=0,
+        min_interval_s=0,
+    )
+
+
+def test_fake_server_serves_normalizable_hourly_payload() -> None:
+    with FakeOpenWeatherServer() as server:
+        client = _client(server.base_url)
+        payload = client.fetch_hourly_4d(-33.3, -70.2)
+        client.close()
+    assert payload["city"]["coord"] == {"lat": -33.3, "lon": -70.2}
+    assert len(payload["list"]) == HOURLY_ITEMS
+
+
+def test_client_gives_up_under_429_storm() -> None:
+    config = FakeServerConfig(rate_limit_rate=1.0, retry_after_s=0)
+    with FakeOpenWeatherServer(config) as server:
+        client = _client(server.base_url, max_retries=2)
+        with pytest.raises(RuntimeError):
+            client.fetch_daily_30d(-33.3, -70.2)
+        client.close()
+    assert server.request_count == 3
+
+
+def test_load_test_reports_all_locations() -> None:
+    config = FakeServerConfig(
+        latency_ms=1, latency_distribution=LatencyDistribution.UNIFORM, seed=7
+    )
+    with FakeOpenWeatherServer(config) as server:
+        client = _client(server.base_url)
+        report = run_load_test(client, random_locations(6, seed=7), feed=Feed.DAILY, concurrency=3)
+        client.close()
+    assert report.locations == 6
+    assert report.failed == 0
+    assert report.rows == 6 * 30
+    assert 0 < report.p50_ms <= report.p99_ms <= report.max_ms
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_load_test_counts_and_stores_quarantined_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    stored: list[QuarantinedRecord] = []
+
+    def fake_quarantine(_self: PostgresLoader, records: list[QuarantinedRecord]) -> int:
+        stored.extend(records)
+        return len(records)
+
+    monkeypatch.setattr(PostgresLoader, "quarantine", fake_quarantine)
+    monkeypatch.setattr(PostgresLoader, "write_daily", lambda _self, rows: len(rows))
+    loader = PostgresLoader("postgresql://fake")
+    config = FakeServerConfig(invalid_rate=1.0, seed=1)
+    with FakeOpenWeatherServer(config) as server:
+        client = _client(server.base_url)
+        report = run_load_test(
+            client,
+            random_locations(2, seed=1),
+            feed=Feed.DAILY,
+            concurrency=2,
+            sinks=[loader],
+            quarantine_store=loader,
+        )
+        client.close()
+    assert report.quarantined == 2 * 30
+    assert report.rows == 0
+    assert len(stored) == 2 * 30
+    assert stored[0].reasons == ("humidity_pct must be between 0 and 100",)
+
+
+class _RecordingSink:
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[int] = []
+        self.flushed = False
+        self.fail = fail
+
+    def write_hourly(self, rows: list[HourlyForecastRecord]) -> int:
+        if self.fail:
+            raise OSError("connection reset")
+        self.batches.append(len(rows))
+        return len(rows)
+
+    def write_daily(self, rows: list[DailyForecastRecord]) -> int:
+        self.batches.append(len(rows))
+        return len(rows)
+
+    def flush(self) -> None:
+        self.flushed = True
+
+
+def test_load_test_loads_all_locations_as_one_batch() -> None:
+    sink = _RecordingSink()
+    with FakeOpenWeatherServer() as server:
+        client = _client(server.base_url)
+        report = run_load_test(client, random_locations(3, seed=2), concurrency=3, sinks=[sink])
+        client.close()
+    assert sink.batches == [3 * HOURLY_ITEMS]
+    assert sink.flushed
+    assert report.loaded == 3 * HOURLY_ITEMS
+
+
+def test_load_test_counts_location_and_load_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    def flaky_normalize(payload: dict[str, Any], extracted_at: datetime) -> list[Any]:
+        calls.append(1)
+        if len(calls) == 1:
+            raise KeyError("main")
+        return normalize_hourly_4d(payload, extracted_at)
+
+    monkeypatch.setattr(load_test, "normalize_hourly_4d", flaky_normalize)
+    with FakeOpenWeatherServer() as server:
+        client = _client(server.base_url)
+        report = run_load_test(
+            client, random_locations(3, seed=2), concurrency=1, sinks=[_RecordingSink(fail=True)]
+        )
+        client.close()
+    assert report.locations == 3
+    assert report.failed == 1
+    assert report.rows == 2 * HOURLY_ITEMS
+    assert report.loaded == 0
+    assert report.load_errors == 1
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from weather_etl.common.logger import (
+    SamplingFilter,
+    configure_console_logging,
+    log_context,
+    shutdown_console_logging,
+)
+
+
+@pytest.fixture
+def isolated_logger() -> Iterator[logging.Logger]:
+    logger = logging.getLogger("weather_etl")
+    handlers, level = list(logger.handlers), logger.level
+    yield logger
+    shutdown_console_logging()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+def _record(msg: str, *args: object, level: int = logging.WARNING) -> logging.LogRecord:
+    return logging.LogRecord("weather_etl", level, __file__, 1, msg, args, None)
+
+
+def test_sampling_filter_limits_repeats_per_template() -> None:
+    sampler = SamplingFilter(limit=2, interval_s=0.05)
+    template = "API request failure on attempt %d/%d: %s"
+
+    passed = [sampler.filter(_record(template, n, 5, "boom")) for n in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert sampler.filter(_record("different message"))
+    assert sampler.filter(_record(template, 1, 5, "boom", level=logging.ERROR))
+
+
+def test_sampling_filter_never_drops_info_records() -> None:
+    sampler = SamplingFilter(limit=2, interval_s=60.0)
+    records = [_record("Loaded %d hourly rows", n, level=logging.INFO) for n in range(5)]
+    assert all(sampler.filter(record) for record in records)
+
+
+def test_sampling_filter_reports_suppressed_count_after_window() -> None:
+    sampler = SamplingFilter(limit=1, interval_s=0.05)
+    template = "Rate limit reached. Sleeping %.2fs before retry."
+    assert sampler.filter(_record(template, 1.0))
+    assert not sampler.filter(_record(template, 2.0))
+    time.sleep(0.06)
+
+    record = _record(template, 1.0)
+    assert sampler.filter(record)
+    assert getattr(record, "suppressed", 0) == 1
+
+
+def test_configure_console_logging_writes_json_with_context(
+    isolated_logger: logging.Logger,
+) -> None:
+    stream = io.StringIO()
+    configure_console_logging(level="DEBUG", fmt="json", stream=stream)
+    with log_context(lat=-33.3, lon=-70.2):
+        isolated_logger.debug("Loaded %d hourly rows", 96, extra={"feed": "hourly"})
+    shutdown_console_logging()
+
+    entry = json.loads(stream.getvalue().strip())
+    assert entry["message"] == "Loaded 96 hourly rows"
+    assert entry["level"] == "DEBUG"
+    assert entry["lat"] == -33.3
+    assert entry["lon"] == -70.2
+    assert entry["feed"] == "hourly"
+
+
+def test_json_logging_keeps_traceback_structured(isolated_logger: logging.Logger) -> None:
+    stream = io.StringIO()
+    configure_console_logging(fmt="json", stream=stream)
+    try:
+        raise ValueError("bad payload")
+    except ValueError:
+        isolated_logger.exception("Normalization failed for %s", "hourly")
+    shutdown_console_logging()
+
+    entry = json.loads(stream.getvalue().strip())
+    assert entry["message"] == "Normalization failed for hourly"
+    assert "ValueError: bad payload" in entry["exc_info"]
+
+
+def test_text_logging_includes_context_fields(isolated_logger: logging.Logger) -> None:
+    stream = io.StringIO()
+    configure_console_logging(fmt="text", stream=stream)
+    with log_context(feed="daily", lat=1.5, lon=2.5):
+        isolated_logger.info("Loaded %d daily rows", 30)
+    shutdown_console_logging()
+
+    line = stream.getvalue().strip()
+    assert line.endswith("INFO: Loaded 30 daily rows [feed=daily lat=1.5 lon=2.5]")
+    assert not isolated_logger.handlers
+
+
+def test_queued_records_freeze_arguments_at_call_time(isolated_logger: logging.Logger) -> None:
+    stream = io.StringIO()
+    configure_console_logging(fmt="text", stream=stream)
+    pending = ["a"]
+    isolated_logger.info("Pending locations: %s", pending)
+    pending.append("b")
+    shutdown_console_logging()
+
+    assert stream.getvalue().strip().endswith("INFO: Pending locations: ['a']")
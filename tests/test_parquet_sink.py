@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from weather_etl.ingestion.models.types import (  # noqa: E402
+    DailyForecastRecord,
+    HourlyForecastRecord,
+)
+from weather_etl.ingestion.ops.load.parquet_sink import ParquetSink  # noqa: E402
+
+
+def _hourly(forecast_at: datetime) -> HourlyForecastRecord:
+    return HourlyForecastRecord(
+        location_name="El Colorado",
+        country_code="CL",
+        lat=-33.3496,
+        lon=-70.2922,
+        forecast_at_utc=forecast_at,
+        temperature_c=2.5,
+        feels_like_c=1.9,
+        temp_min_c=2.2,
+        temp_max_c=2.8,
+        pressure_hpa=1015,
+        sea_level_hpa=None,
+        ground_level_hpa=None,
+        humidity_pct=50,
+        cloudiness_pct=97,
+        wind_speed_ms=1.06,
+        wind_deg=66,
+        wind_gust_ms=2.16,
+        visibility_m=10000,
+        precipitation_probability=0.32,
+        rain_1h_mm=0.13,
+        weather_code=500,
+        weather_main="Rain",
+        weather_description="light rain",
+        weather_icon="10d",
+        pod="d",
+        source_payload_ts=datetime(2022, 8, 30, tzinfo=UTC),
+    )
+
+
+def test_parquet_sink_buffers_until_flush(tmp_path: Path) -> None:
+    rows = [
+        _hourly(datetime(2022, 8, 31, 0, tzinfo=UTC)),
+        _hourly(datetime(2022, 8, 30, 22, tzinfo=UTC)),
+        _hourly(datetime(2022, 8, 30, 23, tzinfo=UTC)),
+    ]
+    sink = ParquetSink(tmp_path, compression="zstd")
+
+    assert sink.write_hourly(rows) == 3
+    assert not any(tmp_path.iterdir())
+    sink.flush()
+
+    files = list((tmp_path / "hourly_forecast" / "extracted_date=2022-08-30").glob("*.parquet"))
+    assert len(files) == 1
+    parquet_file = pq.ParquetFile(files[0])
+    assert parquet_file.metadata.num_rows == 3
+    assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+    table = parquet_file.read()
+    assert table.column("sea_level_hpa").null_count == 3
+    assert [ts.hour for ts in table.column("forecast_at_utc").to_pylist()] == [22, 23, 0]
+
+
+def _daily(forecast_date: date, lat: float = -33.3496) -> DailyForecastRecord:
+    return DailyForecastRecord(
+        location_name="El Colorado",
+        country_code="CL",
+        lat=lat,
+        lon=-70.2922,
+        forecast_date=forecast_date,
+        sunrise_utc=None,
+        sunset_utc=None,
+        temp_day_c=5.1,
+        temp_min_c=1.2,
+        temp_max_c=6.7,
+        temp_night_c=1.8,
+        temp_evening_c=4.9,
+        temp_morning_c=2.3,
+        feels_like_day_c=None,
+        feels_like_night_c=None,
+        feels_like_evening_c=None,
+        feels_like_morning_c=None,
+        pressure_hpa=1016,
+        humidity_pct=84,
+        wind_speed_ms=6.78,
+        wind_deg=320,
+        cloudiness_pct=81,
+        rain_mm=1.96,
+        weather_code=500,
+        weather_main="Rain",
+        weather_description="light rain",
+        weather_icon="10d",
+        source_payload_ts=datetime(2020, 7, 10, tzinfo=UTC),
+    )
+
+
+def test_parquet_sink_batches_locations_into_sorted_row_groups(tmp_path: Path) -> None:
+    days = [date(2020, 7, 10) + timedelta(days=offset) for offset in range(30)]
+    sink = ParquetSink(tmp_path, row_group_size=30)
+    for lat in (-33.0, -34.0, -35.0):
+        sink.write_daily([_daily(day, lat) for day in days])
+    sink.flush()
+
+    files = list((tmp_path / "daily_forecast").rglob("*.parquet"))
+    assert len(files) == 1
+    metadata = pq.ParquetFile(files[0]).metadata
+    assert metadata.num_rows == 90
+    assert metadata.num_row_groups == 3
+    date_column = metadata.schema.names.index("forecast_date")
+    stats = [metadata.row_group(i).column(date_column).statistics for i in range(3)]
+    assert stats[0].max < stats[1].min and stats[1].max < stats[2].min
+
+    table = pq.read_table(tmp_path / "daily_forecast")
+    assert table.schema.field("forecast_date").type == pa.date32()
+    assert table.column("extracted_date").to_pylist() == ["2020-07-10"] * 90
+
+
+def test_parquet_sink_flushes_when_buffer_is_full(tmp_path: Path) -> None:
+    sink = ParquetSink(tmp_path, flush_rows=2)
+    sink.write_daily([_daily(date(2020, 7, 10))])
+    assert not any(tmp_path.iterdir())
+    sink.write_daily([_daily(date(2020, 7, 11))])
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+
+
+def test_parquet_sink_ignores_empty_batches(tmp_path: Path) -> None:
+    sink = ParquetSink(tmp_path)
+    assert sink.write_daily([]) == 0
+    sink.flush()
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from threading import Lock
+from typing import Any
+
+import pytest
+
+from weather_etl.ingestion.models.types import DailyForecastRecord
+from weather_etl.ingestion.ops.load.postgres_loader import PostgresLoader, partition_by_location
+from weather_etl.ingestion.ops.transform.validate import validate_daily
+
+BASE = DailyForecastRecord(
+    location_name="El Colorado",
+    country_code="CL",
+    lat=-33.3496,
+    lon=-70.2922,
+    forecast_date=date(2020, 7, 10),
+    sunrise_utc=None,
+    sunset_utc=None,
+    temp_day_c=5.1,
+    temp_min_c=1.2,
+    temp_max_c=6.7,
+    temp_night_c=1.8,
+    temp_evening_c=4.9,
+    temp_morning_c=2.3,
+    feels_like_day_c=None,
+    feels_like_night_c=None,
+    feels_like_evening_c=None,
+    feels_like_morning_c=None,
+    pressure_hpa=1016,
+    humidity_pct=84,
+    wind_speed_ms=6.78,
+    wind_deg=320,
+    cloudiness_pct=81,
+    rain_mm=1.96,
+    weather_code=500,
+    weather_main="Rain",
+    weather_description="light rain",
+    weather_icon="10d",
+    source_payload_ts=datetime(2020, 7, 10, tzinfo=UTC),
+)
+
+
+def _rows() -> list[DailyForecastRecord]:
+    rows = []
+    for lat in (1.0, 2.0, 3.0):
+        for day in (12, 10, 11):
+            rows.append(replace(BASE, lat=lat, forecast_date=date(2020, 7, day)))
+    return rows
+
+
+def _daily_key(row: DailyForecastRecord) -> tuple[Any, ...]:
+    return (row.lat, row.lon, row.forecast_date)
+
+
+class FakeCursor:
+    def __init__(self, conn: FakeConnection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> FakeCursor:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def executemany(self, _sql: str, payload: list[dict[str, Any]]) -> None:
+        self._conn.pending.extend(payload)
+
+
+class FakeConnection:
+    def __init__(self, commits: list[list[dict[str, Any]]], lock: Lock) -> None:
+        self.pending: list[dict[str, Any]] = []
+        self._commits = commits
+        self._lock = lock
+
+    def __enter__(self) -> FakeConnection:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        with self._lock:
+            self._commits.append(self.pending)
+        self.pending = []
+
+
+def test_partition_by_location_keeps_locations_together_and_sorted() -> None:
+    parts = partition_by_location(_rows(), workers=2, sort_key=_daily_key)
+
+    assert len(parts) == 2
+    assert sorted(len(part) for part in parts) == [3, 6]
+    for part in parts:
+        assert part == sorted(part, key=_daily_key)
+    locations = [{(row.lat, row.lon) for row in part} for part in parts]
+    assert not locations[0] & locations[1]
+
+
+def test_parallel_upsert_commits_in_bounded_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    commits: list[list[dict[str, Any]]] = []
+    lock = Lock()
+    monkeypatch.setattr("psycopg.connect", lambda _dsn: FakeConnection(commits, lock))
+    loader = PostgresLoader("postgresql://fake", workers=3, chunk_size=2)
+
+    result = loader.upsert_daily_parallel(_rows())
+
+    assert result.rows == 9
+    assert result.partitions == 3
+    assert result.chunks == 6
+    assert max(len(chunk) for chunk in commits) == 2
+    assert sum(len(chunk) for chunk in commits) == 9
+    assert loader.write_daily(_rows()) == 9
+
+
+def test_loader_rejects_invalid_worker_count() -> None:
+    with pytest.raises(ValueError):
+        PostgresLoader("postgresql://fake", workers=0)
+
+
+def test_quarantine_stores_reasons(monkeypatch: pytest.MonkeyPatch) -> None:
+    commits: list[list[dict[str, Any]]] = []
+    monkeypatch.setattr("psycopg.connect", lambda _dsn: FakeConnection(commits, Lock()))
+    _, quarantined = validate_daily([replace(BASE, rain_mm=-1.0)])
+
+    assert PostgresLoader("postgresql://fake").quarantine(quarantined) == 1
+    assert commits[0][0]["feed"] == "daily"
+    assert commits[0][0]["reasons"] == ["rain_mm must be >= 0"]
+
+
+def test_quarantine_serialises_non_finite_floats_as_strict_json(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    commits: list[list[dict[str, Any]]] = []
+    monkeypatch.setattr("psycopg.connect", lambda _dsn: FakeConnection(commits, Lock()))
+    bad = replace(BASE, wind_speed_ms=float("nan"), rain_mm=float("inf"))
+    _, quarantined = validate_daily([bad])
+
+    PostgresLoader("postgresql://fake").quarantine(quarantined)
+
+    jsonb = commits[0][0]["record"]
+    text = jsonb.dumps(jsonb.obj)
+    decoded = json.loads(
+        text, parse_constant=lambda token: pytest.fail(f"non-strict JSON token {token}")
+    )
+    assert decoded["wind_speed_ms"] is None
+    assert decoded["rain_mm"] is None
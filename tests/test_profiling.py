@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from weather_etl.common.profiling import StageProfiler
+
+
+def test_disabled_profiler_writes_nothing(tmp_path: Path) -> None:
+    profiler = StageProfiler(tmp_path / "profiles")
+    with profiler.stage("transform"):
+        sum(range(10))
+    assert not (tmp_path / "profiles").exists()
+    assert profiler.artifacts == []
+
+
+def test_enabled_profiler_writes_cpu_and_memory_reports(tmp_path: Path) -> None:
+    profiler = StageProfiler(tmp_path, enabled=True, top_n=5)
+    with profiler.stage("transform"):
+        data = [str(i) for i in range(10_000)]
+    del data
+
+    suffixes = sorted(path.suffix for path in profiler.artifacts)
+    assert suffixes == [".prof", ".txt"]
+    summary = next(p for p in profiler.artifacts if p.suffix == ".txt").read_text()
+    assert "stage: transform" in summary
+    assert "top 5 functions by cumulative time" in summary
+    assert "allocation sites" in summary
+
+
+def test_profilers_in_same_second_do_not_collide(tmp_path: Path) -> None:
+    first, second = StageProfiler(tmp_path, enabled=True), StageProfiler(tmp_path, enabled=True)
+    for profiler in (first, second):
+        with profiler.stage("load", threaded=True):
+            sum(range(10))
+
+    assert not set(first.artifacts) & set(second.artifacts)
+    assert len(list(tmp_path.glob("*.txt"))) == 2
+    summary = next(p for p in first.artifacts if p.suffix == ".txt").read_text()
+    assert "worker threads" in summary
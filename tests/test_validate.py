@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime
+
+from weather_etl.ingestion.ops.transform.normalize import normalize_hourly_4d
+from weather_etl.ingestion.ops.transform.validate import validate_daily, validate_hourly
+
+PAYLOAD = {
+    "city": {"name": "El Colorado", "country": "CL", "coord": {"lat": -33.3496, "lon": -70.2922}},
+    "list": [
+        {
+            "dt": 1661875200 + hour * 3600,
+            "main": {"temp": 2.5, "pressure": 1015, "humidity": 50},
+            "wind": {"speed": 1.06, "deg": 66},
+            "clouds": {"all": 97},
+            "pop": 0.32,
+            "weather": [{"id": 500, "main": "Rain", "description": "light rain", "icon": "10d"}],
+        }
+        for hour in range(3)
+    ],
+}
+
+
+def test_validate_hourly_quarantines_only_offending_rows() -> None:
+    rows = normalize_hourly_4d(PAYLOAD, extracted_at=datetime.now(tz=UTC))
+    rows[1] = replace(rows[1], humidity_pct=120, wind_deg=400)
+    rows[2] = replace(rows[2], precipitation_probability=float("nan"))
+
+    valid, quarantined = validate_hourly(rows)
+
+    assert valid == [rows[0]]
+    assert [item.feed for item in quarantined] == ["hourly", "hourly"]
+    assert quarantined[0].reasons == (
+        "humidity_pct must be between 0 and 100",
+        "wind_deg must be between 0 and 360",
+    )
+    assert quarantined[0].record["forecast_at_utc"] == rows[1].forecast_at_utc
+    assert quarantined[1].reasons == ("precipitation_probability must be between 0 and 1",)
+
+
+def test_validate_daily_accepts_empty_batch() -> None:
+    assert validate_daily([]) == ([], [])